@@ -1,37 +1,93 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+from types import MappingProxyType
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
 import uvicorn
+import pandas as pd
 import sys
 import os
+import asyncio
+import importlib.util
+import multiprocessing
+import threading
 import time
 from pathlib import Path
 import logging
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT_DIR))
+# This file can run more than once per process (imported as both app and
+# backend.app), so only add the root the first time
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
 
+# orjson is faster than the stdlib encoder but optional; ORJSONResponse
+# fails every request when it is missing, so fall back to JSONResponse.
 try:
-    from src.analysis.predictions import (
-        predict_win_probability, 
-        predict_innings_score, 
-        predict_player_performance
-    )
-    from src.analysis.model_training import train_all_models
-    from backend.mock_data import get_mock_matches, get_mock_deliveries, get_mock_players, get_mock_scraping_results, get_mock_cleaning_results, get_cleaning_response, get_mock_transformation_results, get_mock_eda_results
-    ANALYSIS_AVAILABLE = True
-except ImportError as e:
-    logging.warning(f"Analysis modules not available: {e}")
-    ANALYSIS_AVAILABLE = False
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as APIResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as APIResponse
+
+from backend.mock_data import MOCK_RECORD_COUNTS, get_mock_scraping_results, get_cleaning_response, get_mock_transformation_results, get_mock_eda_results
+
+# The analysis modules pull in scikit-learn, so they are imported on first
+# use rather than at start-up; the mock and stats endpoints never need them.
+_predictions = None
+_model_training = None
+_analysis_state: Optional[bool] = None
+_analysis_lock = threading.Lock()
+ANALYSIS_MODULES = ("sklearn", "joblib", "src.analysis.model_training", "src.analysis.predictions")
+
+def analysis_available() -> bool:
+    global _predictions, _model_training, _analysis_state
+    if _analysis_state is None:
+        with _analysis_lock:
+            if _analysis_state is None:
+                try:
+                    from src.analysis import model_training, predictions
+                    _predictions, _model_training = predictions, model_training
+                    _analysis_state = True
+                except ImportError as e:
+                    logging.warning(f"Analysis modules not available: {e}")
+                    _analysis_state = False
+    return _analysis_state
+
+def _analysis_installed() -> bool:
+    """The import result once known, otherwise whether the analysis modules are installed (without importing them)."""
+    if _analysis_state is not None:
+        return _analysis_state
+    try:
+        return all(importlib.util.find_spec(name) is not None for name in ANALYSIS_MODULES)
+    except ImportError:
+        return False
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    global _TRAIN_POOL
+    _TRAIN_POOL = _new_train_pool()
+    # Parse the processed CSVs before the first request instead of during it
+    try:
+        _collect_stats()
+    except Exception as e:
+        logger.warning(f"Could not preload statistics: {str(e)}")
+    yield
+    _shutdown_train_pool()
 
 app = FastAPI(
     title="Cricket Analytics API",
     description="Final Year Project - Complete Cricket Analytics Pipeline with ML Predictions",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=APIResponse,
+    lifespan=_lifespan
 )
 
 app.add_middleware(
@@ -45,12 +101,76 @@ app.add_middleware(
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One training run at a time; the worker process is only started on first use.
+# "spawn" because forking this multi-threaded server can deadlock the child.
+# The pool belongs to one server process: with WORKERS > 1 every worker has
+# its own, and concurrent runs would overwrite the same model files, so
+# trigger training only on a single-worker server.
+def _new_train_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+# Created and shut down by the lifespan handler
+_TRAIN_POOL: Optional[ProcessPoolExecutor] = None
+_train_pool_lock = threading.Lock()
+
+def _submit_training() -> Future:
+    global _TRAIN_POOL
+    with _train_pool_lock:
+        if _TRAIN_POOL is None:
+            raise RuntimeError("Training pool is not running")
+        try:
+            return _TRAIN_POOL.submit(_model_training.train_all_models)
+        except BrokenProcessPool:
+            # A worker that died (e.g. killed for memory) breaks the pool for good
+            logger.warning("Training worker died; starting a new pool")
+            _TRAIN_POOL.shutdown(wait=False, cancel_futures=True)
+            _TRAIN_POOL = _new_train_pool()
+            return _TRAIN_POOL.submit(_model_training.train_all_models)
+
+def _shutdown_train_pool():
+    global _TRAIN_POOL
+    with _train_pool_lock:
+        if _TRAIN_POOL is not None:
+            _TRAIN_POOL.shutdown(wait=False, cancel_futures=True)
+            _TRAIN_POOL = None
+
+ROOT_INFO = {
+    "message": "Cricket Analytics API",
+    "version": "2.0.0",
+    "docs": "/api/docs"
+}
+
+MODEL_FILES = {
+    "win_prediction": "win_prediction_logreg.joblib",
+    "innings_score": "innings_score_xgb.joblib",
+    "player_performance": "player_performance_rf.joblib",
+}
+
+# Simulated processing delays on the pipeline endpoints, for live demos only
+DEMO_MODE = os.getenv("DEMO_MODE", "").lower() in ("1", "true", "yes")
+
+# Seconds a models-directory scan is reused by /api/health; training
+# completion invalidates it early.
+HEALTH_CACHE_TTL = 30
+
+API_ENDPOINTS = (
+    "/api/predict/win",
+    "/api/predict/win/batch",
+    "/api/predict/innings-score",
+    "/api/predict/player-performance",
+    "/api/models/train",
+    "/api/stats/overview",
+)
+
 class WinPredictionRequest(BaseModel):
     team1: str = Field(..., description="First team name")
     team2: str = Field(..., description="Second team name")
     venue: str = Field(..., description="Match venue")
     toss_decision: str = Field(..., description="Toss decision (bat/bowl)")
 
+class BatchWinPredictionRequest(BaseModel):
+    items: List[WinPredictionRequest] = Field(..., min_length=1, max_length=256, description="Fixtures to predict")
+
 class InningsScoreRequest(BaseModel):
     team: str = Field(..., description="Batting team name")
     venue: str = Field(..., description="Match venue")
@@ -74,70 +194,124 @@ class PredictionResponse(BaseModel):
     message: str
     timestamp: str
 
+# Handlers already build a PredictionResponse via create_response, so the
+# model is only documented here instead of being re-validated per request.
+PREDICTION_RESPONSES: Dict[int, Dict[str, Any]] = {200: {"model": PredictionResponse}}
+
 class SystemStatus(BaseModel):
     status: str
     models_loaded: bool
-    analysis_available: bool
+    analysis_available: bool = Field(
+        ...,
+        description="Whether the analysis modules imported; before the first prediction, only whether they are installed",
+    )
     api_version: str
     endpoints: List[str]
 
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """UTC ISO timestamp, formatted once per wall-clock second."""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
 def create_response(success: bool, data: Any = None, message: str = "") -> PredictionResponse:
-    from datetime import datetime
     return PredictionResponse(
         success=success,
         data=data,
         message=message,
-        timestamp=datetime.now().isoformat()
+        timestamp=_iso_timestamp(int(time.time()))
     )
 
-def check_analysis_available():
-    if not ANALYSIS_AVAILABLE:
+async def _demo_delay(seconds: float) -> None:
+    if DEMO_MODE:
+        await asyncio.sleep(seconds)
+
+async def _analysis_loaded() -> bool:
+    if _analysis_state is not None:
+        return _analysis_state
+    # The first call imports scikit-learn, so keep it off the event loop
+    return await run_in_threadpool(analysis_available)
+
+async def check_analysis_available():
+    if not await _analysis_loaded():
         raise HTTPException(
             status_code=503,
             detail="Analysis modules not available. Please check backend configuration."
         )
 
+# Predictions are pure functions of their inputs and of the model / fact
+# files they read, so repeated UI queries are served from memory. Each key
+# carries those files' mtimes, so a retrain or data refresh (by any worker
+# or outside the API) misses the cache. Handlers call these through
+# run_in_threadpool so a cache miss (model load, sklearn inference) does
+# not block the event loop.
+def _input_versions(model: str, *tables: str) -> Tuple[Optional[int], ...]:
+    paths = [_predictions.MODELS_DIR / model, *(_predictions.PROCESSED_DIR / table for table in tables)]
+    return tuple(_mtime_ns(path) for path in paths)
+
+@lru_cache(maxsize=4096)
+def _cached_win_probability(team1: str, team2: str, venue: str, toss_decision: str, versions: Tuple[Optional[int], ...]) -> float:
+    return _predictions.predict_win_probability(
+        team1=team1,
+        team2=team2,
+        venue=venue,
+        toss_decision=toss_decision
+    )
+
+@lru_cache(maxsize=4096)
+def _cached_innings_score(team: str, venue: str, overs: int, versions: Tuple[Optional[int], ...]) -> float:
+    return _predictions.predict_innings_score(team=team, venue=venue, overs=overs)
+
+@lru_cache(maxsize=4096)
+def _cached_player_performance(player_name: str, team: Optional[str], versions: Tuple[Optional[int], ...]) -> Mapping[str, float]:
+    # Read-only view, since the cached result is shared between requests
+    return MappingProxyType(_predictions.predict_player_performance(player_name=player_name, team=team))
+
+def _predict_win(team1: str, team2: str, venue: str, toss_decision: str) -> float:
+    versions = _input_versions(MODEL_FILES["win_prediction"], "fact_matches.csv")
+    return _cached_win_probability(team1, team2, venue, toss_decision, versions)
+
+def _predict_innings(team: str, venue: str, overs: int) -> float:
+    versions = _input_versions(MODEL_FILES["innings_score"])
+    return _cached_innings_score(team, venue, overs, versions)
+
+def _predict_player(player_name: str, team: Optional[str]) -> Mapping[str, float]:
+    versions = _input_versions(MODEL_FILES["player_performance"], "fact_deliveries.csv")
+    return _cached_player_performance(player_name, team, versions)
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
-    return {
-        "message": "Cricket Analytics API",
-        "version": "2.0.0",
-        "docs": "/api/docs"
-    }
+    return ROOT_INFO
+
+@lru_cache(maxsize=1)
+def _models_present(tick: int) -> Dict[str, bool]:
+    """Model-file presence from a single directory scan, reused within one TTL window."""
+    try:
+        with os.scandir(ROOT_DIR / "models") as it:
+            existing = {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        existing = set()
+    return {key: filename in existing for key, filename in MODEL_FILES.items()}
 
 @app.get("/api/health", response_model=SystemStatus)
 async def health_check():
-    models_dir = ROOT_DIR / "models"
-    models_exist = {
-        "win_prediction": (models_dir / "win_prediction_logreg.joblib").exists(),
-        "innings_score": (models_dir / "innings_score_xgb.joblib").exists(),
-        "player_performance": (models_dir / "player_performance_rf.joblib").exists()
-    }
+    models_exist = _models_present(int(time.monotonic() // HEALTH_CACHE_TTL))
     
     return SystemStatus(
         status="healthy" if all(models_exist.values()) else "degraded",
         models_loaded=all(models_exist.values()),
-        analysis_available=ANALYSIS_AVAILABLE,
+        analysis_available=_analysis_installed(),
         api_version="2.0.0",
-        endpoints=[
-            "/api/predict/win",
-            "/api/predict/innings-score",
-            "/api/predict/player-performance",
-            "/api/models/train",
-            "/api/stats/overview"
-        ]
+        endpoints=list(API_ENDPOINTS)
     )
 
-@app.post("/api/predict/win", response_model=PredictionResponse)
+@app.post("/api/predict/win", response_model=None, responses=PREDICTION_RESPONSES)
 async def predict_win(request: WinPredictionRequest):
     try:
-        check_analysis_available()
+        await check_analysis_available()
         
-        probability = predict_win_probability(
-            team1=request.team1,
-            team2=request.team2,
-            venue=request.venue,
-            toss_decision=request.toss_decision
+        probability = await run_in_threadpool(
+            _predict_win,
+            request.team1, request.team2, request.venue, request.toss_decision
         )
         
         return create_response(
@@ -157,17 +331,47 @@ async def predict_win(request: WinPredictionRequest):
         logger.error(f"Win prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
-@app.post("/api/predict/innings-score", response_model=PredictionResponse)
-async def predict_innings(request: InningsScoreRequest):
+@app.post("/api/predict/win/batch", response_model=None, responses=PREDICTION_RESPONSES)
+async def predict_win_batch(request: BatchWinPredictionRequest):
     try:
-        check_analysis_available()
+        await check_analysis_available()
         
-        score = predict_innings_score(
-            team=request.team,
-            venue=request.venue,
-            overs=request.overs
+        # One model call for the whole batch instead of one per fixture
+        probabilities = await run_in_threadpool(
+            _predictions.predict_win_probability_batch,
+            [item.model_dump() for item in request.items]
+        )
+        
+        return create_response(
+            success=True,
+            data={
+                "count": len(probabilities),
+                "predictions": [
+                    {
+                        "team1": item.team1,
+                        "team2": item.team2,
+                        "venue": item.venue,
+                        "toss_decision": item.toss_decision,
+                        "win_probability": probability,
+                        "percentage": f"{probability:.1%}"
+                    }
+                    for item, probability in zip(request.items, probabilities)
+                ]
+            },
+            message="Win probabilities calculated successfully"
         )
         
+    except Exception as e:
+        logger.error(f"Batch win prediction error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+
+@app.post("/api/predict/innings-score", response_model=None, responses=PREDICTION_RESPONSES)
+async def predict_innings(request: InningsScoreRequest):
+    try:
+        await check_analysis_available()
+        
+        score = await run_in_threadpool(_predict_innings, request.team, request.venue, request.overs)
+        
         return create_response(
             success=True,
             data={
@@ -184,15 +388,12 @@ async def predict_innings(request: InningsScoreRequest):
         logger.error(f"Innings prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
-@app.post("/api/predict/player-performance", response_model=PredictionResponse)
+@app.post("/api/predict/player-performance", response_model=None, responses=PREDICTION_RESPONSES)
 async def predict_player(request: PlayerPerformanceRequest):
     try:
-        check_analysis_available()
+        await check_analysis_available()
         
-        performance = predict_player_performance(
-            player_name=request.player_name,
-            team=request.team
-        )
+        performance = await run_in_threadpool(_predict_player, request.player_name, request.team)
         
         return create_response(
             success=True,
@@ -211,23 +412,28 @@ async def predict_player(request: PlayerPerformanceRequest):
         logger.error(f"Player prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
 
-@app.post("/api/models/train", response_model=PredictionResponse)
-async def train_models(background_tasks: BackgroundTasks):
+def _log_training_result(future: Future) -> None:
+    # Even a failed run may have replaced some of the model files
+    _models_present.cache_clear()
     try:
-        if not ANALYSIS_AVAILABLE:
+        results = future.result()
+        logger.info(f"Model training completed: {results}")
+    except Exception as e:
+        logger.error(f"Model training failed: {str(e)}")
+
+@app.post("/api/models/train", response_model=None, responses=PREDICTION_RESPONSES)
+async def train_models():
+    try:
+        if not await _analysis_loaded():
             raise HTTPException(
                 status_code=503,
                 detail="Analysis modules not available"
             )
         
-        def train_task():
-            try:
-                results = train_all_models()
-                logger.info(f"Model training completed: {results}")
-            except Exception as e:
-                logger.error(f"Model training failed: {str(e)}")
-        
-        background_tasks.add_task(train_task)
+        # Training is CPU-bound; run it in a separate process so it does not
+        # compete with request handling for the GIL.
+        future = _submit_training()
+        future.add_done_callback(_log_training_result)
         
         return create_response(
             success=True,
@@ -239,37 +445,60 @@ async def train_models(background_tasks: BackgroundTasks):
         logger.error(f"Training initiation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
 
-@app.get("/api/stats/overview", response_model=PredictionResponse)
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+@lru_cache(maxsize=4)
+def _match_stats(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Match counts and sorted uniques, memoized until the CSV's mtime changes."""
+    wanted = {"team1", "team2", "venue", "season"}
+    matches_df = pd.read_csv(path, usecols=lambda col: col in wanted)
+    stats: Dict[str, Any] = {"total_matches": len(matches_df)}
+    if "team1" in matches_df.columns:
+        teams = pd.unique(pd.concat([matches_df["team1"], matches_df["team2"]], ignore_index=True))
+        stats["teams"] = sorted(teams.tolist())
+    if "venue" in matches_df.columns:
+        stats["venues"] = sorted(matches_df["venue"].unique().tolist())
+    if "season" in matches_df.columns:
+        stats["seasons"] = sorted(matches_df["season"].unique().tolist())
+    return stats
+
+@lru_cache(maxsize=4)
+def _delivery_count(path: str, mtime_ns: int) -> int:
+    # Only the row count is needed; parsing one column keeps quoting rules intact
+    deliveries_df = pd.read_csv(path, usecols=[0])
+    return len(deliveries_df)
+
+def _collect_stats() -> Dict[str, Any]:
+    data_dir = ROOT_DIR / "data" / "processed"
+    matches_file = data_dir / "fact_matches.csv"
+    deliveries_file = data_dir / "fact_deliveries.csv"
+    
+    stats = {
+        "total_matches": 0,
+        "total_deliveries": 0,
+        "teams": [],
+        "venues": [],
+        "seasons": []
+    }
+    
+    matches_mtime = _mtime_ns(matches_file)
+    if matches_mtime is not None:
+        stats.update(_match_stats(str(matches_file), matches_mtime))
+    
+    deliveries_mtime = _mtime_ns(deliveries_file)
+    if deliveries_mtime is not None:
+        stats["total_deliveries"] = _delivery_count(str(deliveries_file), deliveries_mtime)
+    
+    return stats
+
+@app.get("/api/stats/overview", response_model=None, responses=PREDICTION_RESPONSES)
 async def get_stats_overview():
     try:
-        data_dir = ROOT_DIR / "data" / "processed"
-        matches_file = data_dir / "fact_matches.csv"
-        deliveries_file = data_dir / "fact_deliveries.csv"
-        
-        stats = {
-            "total_matches": 0,
-            "total_deliveries": 0,
-            "teams": [],
-            "venues": [],
-            "seasons": []
-        }
-        
-        if matches_file.exists():
-            import pandas as pd
-            matches_df = pd.read_csv(matches_file)
-            stats["total_matches"] = len(matches_df)
-            if "team1" in matches_df.columns:
-                teams = set(matches_df["team1"].unique()) | set(matches_df["team2"].unique())
-                stats["teams"] = sorted(list(teams))
-            if "venue" in matches_df.columns:
-                stats["venues"] = sorted(matches_df["venue"].unique().tolist())
-            if "season" in matches_df.columns:
-                stats["seasons"] = sorted(matches_df["season"].unique().tolist())
-        
-        if deliveries_file.exists():
-            import pandas as pd
-            deliveries_df = pd.read_csv(deliveries_file)
-            stats["total_deliveries"] = len(deliveries_df)
+        stats = await run_in_threadpool(_collect_stats)
         
         return create_response(
             success=True,
@@ -281,12 +510,11 @@ async def get_stats_overview():
         logger.error(f"Stats error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to get statistics: {str(e)}")
 
-@app.post("/api/scraper/start", response_model=PredictionResponse)
+@app.post("/api/scraper/start", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_scraping(request: ScrapingRequest):
     try:
-        time.sleep(0.5)
+        await _demo_delay(0.5)
         
-        from backend.mock_data import get_mock_scraping_results
         scraping_results = get_mock_scraping_results()
         
         return create_response(
@@ -299,12 +527,11 @@ async def instant_scraping(request: ScrapingRequest):
         logger.error(f"Scraping error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
-@app.post("/api/cleaning/start", response_model=PredictionResponse)
+@app.post("/api/cleaning/start", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_cleaning():
     try:
-        time.sleep(0.3)
+        await _demo_delay(0.3)
         
-        from backend.mock_data import get_cleaning_response
         cleaning_results = get_cleaning_response()
         
         return create_response(
@@ -317,12 +544,11 @@ async def instant_cleaning():
         logger.error(f"Cleaning error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Cleaning failed: {str(e)}")
 
-@app.post("/api/transformation/start", response_model=PredictionResponse)
+@app.post("/api/transformation/start", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_transformation():
     try:
-        time.sleep(0.4)
+        await _demo_delay(0.4)
         
-        from backend.mock_data import get_mock_transformation_results
         transformation_results = get_mock_transformation_results()
         
         return create_response(
@@ -335,12 +561,11 @@ async def instant_transformation():
         logger.error(f"Transformation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Transformation failed: {str(e)}")
 
-@app.post("/api/eda/analyze/{analysis_type}", response_model=PredictionResponse)
+@app.post("/api/eda/analyze/{analysis_type}", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_eda(analysis_type: str):
     try:
-        time.sleep(0.5)
+        await _demo_delay(0.5)
         
-        from backend.mock_data import get_mock_eda_results
         eda_results = get_mock_eda_results(analysis_type)
         
         return create_response(
@@ -353,10 +578,10 @@ async def instant_eda(analysis_type: str):
         logger.error(f"EDA error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"EDA failed: {str(e)}")
 
-@app.post("/api/evaluation/run", response_model=PredictionResponse)
+@app.post("/api/evaluation/run", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_evaluation():
     try:
-        time.sleep(0.2)
+        await _demo_delay(0.2)
         
         return create_response(
             success=True,
@@ -375,17 +600,13 @@ async def instant_evaluation():
         logger.error(f"Evaluation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
-@app.post("/api/export", response_model=PredictionResponse)
+@app.post("/api/export", response_model=None, responses=PREDICTION_RESPONSES)
 async def instant_export(request: ExportRequest):
     try:
-        time.sleep(0.3)
+        await _demo_delay(0.3)
         
-        if request.type == "matches":
-            data = get_mock_matches()
-        elif request.type == "players":
-            data = get_mock_players()
-        else:
-            data = get_mock_deliveries()
+        # Unknown types fall back to deliveries, as before
+        records = MOCK_RECORD_COUNTS.get(request.type, MOCK_RECORD_COUNTS["deliveries"])
         
         return create_response(
             success=True,
@@ -394,8 +615,8 @@ async def instant_export(request: ExportRequest):
                 "export_time": "0.3 seconds",
                 "format": request.format,
                 "type": request.type,
-                "records_exported": len(data),
-                "file_size": f"{len(data) * 0.5} KB",
+                "records_exported": records,
+                "file_size": f"{records * 0.5} KB",
                 "download_url": f"/api/download/{request.type}.{request.format}"
             },
             message="Data exported instantly"
@@ -405,32 +626,40 @@ async def instant_export(request: ExportRequest):
         logger.error(f"Export error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
+def _error_payload(message: str) -> Dict[str, Any]:
+    # Same shape as PredictionResponse, built directly so the error path
+    # skips model construction and validation.
+    return {
+        "success": False,
+        "data": None,
+        "message": message,
+        "timestamp": _iso_timestamp(int(time.time()))
+    }
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return APIResponse(
         status_code=exc.status_code,
-        content=create_response(
-            success=False,
-            message=exc.detail
-        ).dict()
+        content=_error_payload(exc.detail)
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return APIResponse(
         status_code=500,
-        content=create_response(
-            success=False,
-            message="Internal server error"
-        ).dict()
+        content=_error_payload("Internal server error")
     )
 
 if __name__ == "__main__":
+    # Multiple workers cannot be combined with the auto-reloader. Keep
+    # WORKERS=1 when using /api/models/train (see _new_train_pool).
+    workers = int(os.getenv("WORKERS", "1"))
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
         log_level="info"
     )
@@ -4,13 +4,14 @@ Optimized for lightning-fast demo responses
 """
 
 import json
-import time
 from datetime import datetime
 from typing import Dict, List, Any
 
 class MockDataGenerator:
     """Generate realistic cricket data instantly for demo purposes"""
     
+    __slots__ = ("teams", "venues", "players")
+    
     def __init__(self):
         self.teams = [
             "India", "Australia", "England", "Pakistan", "South Africa", 
@@ -125,15 +126,24 @@ class MockDataGenerator:
 # Global instance
 mock_generator = MockDataGenerator()
 
+# The mock tables never change, so build them once at import
+_MATCHES: List[Dict] = mock_generator.generate_match_data()
+_DELIVERIES: List[Dict] = mock_generator.generate_delivery_data()
+_PLAYER_STATS: List[Dict] = mock_generator.generate_player_stats()
+
+# Record counts per exportable table, for callers that only need the size
+MOCK_RECORD_COUNTS: Dict[str, int] = {
+    "matches": len(_MATCHES),
+    "players": len(_PLAYER_STATS),
+    "deliveries": len(_DELIVERIES),
+}
+
 def get_mock_matches() -> List[Dict]:
     """Get mock match data instantly"""
-    time.sleep(0.1)  # Simulate minimal processing time
-    return mock_generator.generate_match_data()
+    return list(_MATCHES)
 
 def get_mock_scraping_results():
     """Generate realistic scraping results for industry-standard response"""
-    time.sleep(0.1)  # Simulate minimal processing time
-    
     return {
         "success": True,
         "message": "Data scraped successfully",
@@ -144,22 +154,23 @@ def get_mock_scraping_results():
             "scraping_time": "0.5 seconds",
             "status": "completed",
             "sample_data": {
-                "matches": get_mock_matches()[:2],
-                "players": mock_generator.generate_player_stats()[:5],
-                "deliveries": mock_generator.generate_delivery_data()[:5]
+                "matches": _MATCHES[:2],
+                "players": _PLAYER_STATS[:5],
+                "deliveries": _DELIVERIES[:5]
             }
         }
     }
 
 def get_mock_deliveries() -> List[Dict]:
     """Get mock delivery data instantly"""
-    time.sleep(0.1)  # Simulate minimal processing time
-    return mock_generator.generate_delivery_data()
+    return list(_DELIVERIES)
+
+def get_mock_players() -> List[Dict]:
+    """Get mock player statistics instantly"""
+    return list(_PLAYER_STATS)
 
 def get_mock_cleaning_results():
     """Generate realistic cleaning results for industry-standard response"""
-    time.sleep(0.3)  # Simulate minimal processing time
-    
     return {
         "success": True,
         "message": "Data cleaned successfully",
@@ -177,62 +188,79 @@ def get_mock_cleaning_results():
         }
     }
 
+_CLEANING_RESPONSE: Dict[str, Any] = {
+    "beforeRecords": 15234,
+    "removed": 3000,
+    "afterRecords": 12234,
+    "cleaning_time": "0.3 seconds",
+    "status": "completed",
+    "data_quality_score": 98.5,
+    "sample": [
+        {"player": "Virat Kohli", "runs": 82, "strikeRate": 134.2},
+        {"player": "Rohit Sharma", "runs": 61, "strikeRate": 128.5},
+        {"player": "KL Rahul", "runs": 45, "strikeRate": 142.8},
+        {"player": "Suryakumar Yadav", "runs": 38, "strikeRate": 156.3},
+        {"player": "Hardik Pandya", "runs": 29, "strikeRate": 118.7}
+    ]
+}
+
 def get_cleaning_response():
     """Direct response for frontend - matches expected structure"""
+    return dict(_CLEANING_RESPONSE)
+
+def get_mock_transformation_results():
+    """Generate realistic feature engineering results for industry-standard response"""
     return {
-        "beforeRecords": 15234,
-        "removed": 3000,
-        "afterRecords": 12234,
-        "cleaning_time": "0.3 seconds",
-        "status": "completed",
-        "data_quality_score": 98.5,
-        "sample": [
-            {"player": "Virat Kohli", "runs": 82, "strikeRate": 134.2},
-            {"player": "Rohit Sharma", "runs": 61, "strikeRate": 128.5},
-            {"player": "KL Rahul", "runs": 45, "strikeRate": 142.8},
-            {"player": "Suryakumar Yadav", "runs": 38, "strikeRate": 156.3},
-            {"player": "Hardik Pandya", "runs": 29, "strikeRate": 118.7}
-        ]
+        "success": True,
+        "message": "Data transformed successfully",
+        "data": {
+            "features_created": 24,
+            "records_processed": 12234,
+            "data_quality_score": 99.1,
+            "processing_time": "0.4 seconds",
+            "status": "completed",
+            "sample_features": [
+                {"player": "Virat Kohli", "strike_rate": 134.2, "batting_average": 52.8, "form_index": 0.92, "momentum_score": 8.7},
+                {"player": "Rohit Sharma", "strike_rate": 128.5, "batting_average": 48.6, "form_index": 0.85, "momentum_score": 8.1},
+                {"player": "KL Rahul", "strike_rate": 142.8, "batting_average": 45.3, "form_index": 0.78, "momentum_score": 7.4}
+            ]
+        }
     }
 
+# Precomputed EDA payloads, keyed by analysis type
+_EDA_RESULTS: Dict[str, Dict[str, Any]] = {
+    "overview": {
+        "total_matches": 156,
+        "total_players": 48,
+        "data_range": "2020-2024",
+        "data_quality": 98.5
+    },
+    "scoring": {
+        "avg_score": 285.6,
+        "highest_score": 264,
+        "avg_strike_rate": 128.5,
+        "total_centuries": 45
+    },
+    "bowling": {
+        "avg_economy": 7.2,
+        "best_bowling": "5/23",
+        "dot_balls_percentage": 38.5,
+        "wickets_per_match": 3.8
+    },
+    "venue": {
+        "total_venues": 24,
+        "highest_avg_score": 312,
+        "lowest_avg_score": 245,
+        "day_night_split": "65/35"
+    },
+    "toss": {
+        "toss_win_percentage": 52.3,
+        "bat_first_win_percentage": 58.7,
+        "field_first_win_percentage": 41.3,
+        "decision_impact": "High"
+    }
+}
+
 def get_mock_eda_results(analysis_type):
     """Generate realistic EDA results for different analysis types"""
-    time.sleep(0.5)  # Simulate processing time
-    
-    if analysis_type == "overview":
-        return {
-            "total_matches": 156,
-            "total_players": 48,
-            "data_range": "2020-2024",
-            "data_quality": 98.5
-        }
-    elif analysis_type == "scoring":
-        return {
-            "avg_score": 285.6,
-            "highest_score": 264,
-            "avg_strike_rate": 128.5,
-            "total_centuries": 45
-        }
-    elif analysis_type == "bowling":
-        return {
-            "avg_economy": 7.2,
-            "best_bowling": "5/23",
-            "dot_balls_percentage": 38.5,
-            "wickets_per_match": 3.8
-        }
-    elif analysis_type == "venue":
-        return {
-            "total_venues": 24,
-            "highest_avg_score": 312,
-            "lowest_avg_score": 245,
-            "day_night_split": "65/35"
-        }
-    elif analysis_type == "toss":
-        return {
-            "toss_win_percentage": 52.3,
-            "bat_first_win_percentage": 58.7,
-            "field_first_win_percentage": 41.3,
-            "decision_impact": "High"
-        }
-    else:
-        return {}
+    return dict(_EDA_RESULTS.get(analysis_type, {}))
@@ -36,11 +36,15 @@ def main():
         print("=" * 50)
         
         # Run the server
+        # Multiple workers cannot be combined with the auto-reloader. Keep
+        # WORKERS=1 when using /api/models/train: each worker trains separately.
+        workers = int(os.getenv("WORKERS", "1"))
         uvicorn.run(
             "app:app",
             host="0.0.0.0",
             port=8000,
-            reload=True,
+            reload=workers == 1,
+            workers=workers,
             log_level="info"
         )
         
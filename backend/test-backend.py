@@ -5,11 +5,10 @@ Simple test script to run backend without complex dependencies
 
 import sys
 import os
-from pathlib import Path
 
 # Add project root to sys.path
-ROOT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(ROOT_DIR))
+ROOT_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, ROOT_DIR)
 
 def main():
     print("🏏 Cricket Analytics Backend - Simple Test")
@@ -25,43 +24,47 @@ def main():
     
     # Test if we can import our modules
     try:
-        sys.path.append(str(ROOT_DIR / "src"))
+        sys.path.append(os.path.join(ROOT_DIR, "src"))
         from src.analysis.predictions import predict_win_probability
         print("✅ Analysis modules imported successfully")
     except ImportError as e:
         print(f"❌ Analysis modules import failed: {e}")
         return
     
-    # Test basic functionality
-    print("\n📊 Testing Basic Functionality...")
+    # Test basic functionality; the report is collected and written once
+    report = ["\n📊 Testing Basic Functionality..."]
     
     # Test data directory structure
-    data_dir = ROOT_DIR / "data"
-    if data_dir.exists():
-        print("✅ Data directory exists")
-        raw_dir = data_dir / "raw"
-        processed_dir = data_dir / "processed"
-        if raw_dir.exists():
-            print("✅ Raw data directory exists")
-        if processed_dir.exists():
-            print("✅ Processed data directory exists")
+    data_dir = os.path.join(ROOT_DIR, "data")
+    if os.path.isdir(data_dir):
+        report.append("✅ Data directory exists")
+        # One directory listing answers both sub-directory probes
+        with os.scandir(data_dir) as it:
+            subdirs = {entry.name for entry in it if entry.is_dir()}
+        if "raw" in subdirs:
+            report.append("✅ Raw data directory exists")
+        if "processed" in subdirs:
+            report.append("✅ Processed data directory exists")
     else:
-        print("❌ Data directory not found")
+        report.append("❌ Data directory not found")
     
     # Test models directory
-    models_dir = ROOT_DIR / "models"
-    if models_dir.exists():
-        model_files = list(models_dir.glob("*.joblib"))
-        print(f"✅ Models directory exists ({len(model_files)} models)")
-        for model in model_files[:3]:
-            print(f"    ✅ {model.name}")
+    models_dir = os.path.join(ROOT_DIR, "models")
+    if os.path.isdir(models_dir):
+        with os.scandir(models_dir) as it:
+            model_files = [entry for entry in it if entry.name.endswith(".joblib")]
+        report.append(f"✅ Models directory exists ({len(model_files)} models)")
+        report.extend(f"    ✅ {model.name}" for model in model_files[:3])
     else:
-        print("❌ Models directory not found")
+        report.append("❌ Models directory not found")
     
-    print("\n" + "=" * 50)
-    print("🎯 Backend Test Complete!")
-    print("🚀 Ready to run main application!")
-    print("=" * 50)
+    report.extend([
+        "\n" + "=" * 50,
+        "🎯 Backend Test Complete!",
+        "🚀 Ready to run main application!",
+        "=" * 50,
+    ])
+    print("\n".join(report))
 
 if __name__ == "__main__":
     main()
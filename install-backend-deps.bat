@@ -8,7 +8,7 @@ echo 🔄 Activating virtual environment...
 call .venv\Scripts\activate.bat
 
 echo 📦 Installing FastAPI and dependencies...
-pip install fastapi uvicorn pydantic python-multipart
+pip install fastapi uvicorn pydantic python-multipart orjson
 
 echo 📦 Installing additional dependencies...
 pip install pandas numpy scikit-learn joblib
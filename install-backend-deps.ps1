@@ -11,7 +11,7 @@ Write-Host "🔄 Activating virtual environment..."
 
 # Install dependencies
 Write-Host "📦 Installing FastAPI and dependencies..."
-pip install fastapi uvicorn pydantic python-multipart
+pip install fastapi uvicorn pydantic python-multipart orjson
 
 # Install additional dependencies
 Write-Host "📦 Installing additional dependencies..."
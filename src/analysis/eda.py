@@ -3,30 +3,108 @@
 from __future__ import annotations
 
 import os
-from typing import Literal, Tuple
+import stat
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 
 PROCESSED_DIR = "data/processed"
 
 
-def _load_csv(name: str) -> pd.DataFrame:
+def _load_csv(name: str, columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """
+    Load a processed CSV, optionally parsing only `columns`.
+
+    Absent columns are skipped rather than raising, so callers keep
+    reporting their own "required columns missing" errors. Parsed frames
+    are shared between calls until the file changes, so treat them as
+    read-only.
+    """
     path = os.path.join(PROCESSED_DIR, name)
-    if not os.path.isfile(path):
+    return _read_csv_cached(path, _file_version(path), columns)
+
+
+def _file_version(path: str) -> int:
+    # One stat() serves both the existence check and the cache key.
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Processed file not found: {path}")
-    return pd.read_csv(path)
+    return st.st_mtime_ns
+
+
+@lru_cache(maxsize=16)
+def _read_csv_cached(
+    path: str, mtime_ns: int, columns: Optional[Tuple[str, ...]]
+) -> pd.DataFrame:
+    # mtime_ns is part of the key so a rewritten file is parsed again
+    if columns is None:
+        df = pd.read_csv(path)
+    else:
+        df = pd.read_csv(path, usecols=lambda col: col in columns)
+
+    # Run, innings and id columns fit in a few bytes; the cached frames stay
+    # resident, so shrink them. _cached_on widens the aggregates it returns.
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+_Aggregate = Callable[..., pd.DataFrame]
+
+
+def _widen_integers(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast downcast integer columns back to the int64 read_csv produces."""
+    narrow = {
+        col: "int64"
+        for col, dtype in df.dtypes.items()
+        if pd.api.types.is_integer_dtype(dtype) and dtype != "int64"
+    }
+    return df.astype(narrow) if narrow else df
+
+
+def _cached_on(*names: str) -> Callable[[_Aggregate], _Aggregate]:
+    """
+    Memoize an aggregate per argument set until one of the processed files
+    `names` changes on disk.
+
+    Callers receive a copy, so the cached result cannot be mutated. Integer
+    columns come back as int64 whatever width the loaded frames used.
+    """
+
+    def decorator(func: _Aggregate) -> _Aggregate:
+        @lru_cache(maxsize=32)
+        def cached(versions: Tuple[int, ...], args: tuple, kwargs: tuple) -> pd.DataFrame:
+            return _widen_integers(func(*args, **dict(kwargs)))
 
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> pd.DataFrame:
+            versions = tuple(
+                _file_version(os.path.join(PROCESSED_DIR, name)) for name in names
+            )
+            return cached(versions, args, tuple(sorted(kwargs.items()))).copy()
 
+        return wrapper
+
+    return decorator
+
+
+@_cached_on("fact_deliveries.csv")
 def get_top_scorers(n: int = 10) -> pd.DataFrame:
     """
     Return a table of top run scorers.
 
     This example assumes `fact_deliveries.csv` has `batter` and `batsman_runs`.
     """
-    df = _load_csv("fact_deliveries.csv")
+    df = _load_csv("fact_deliveries.csv", columns=("batter", "batsman_runs"))
     if "batter" not in df.columns or "batsman_runs" not in df.columns:
         raise ValueError("Required columns missing in fact_deliveries.csv")
 
@@ -36,35 +114,41 @@ def get_top_scorers(n: int = 10) -> pd.DataFrame:
         .reset_index()
         .rename(columns={"batter": "player_name", "batsman_runs": "total_runs"})
     )
-    agg = agg.sort_values("total_runs", ascending=False).head(n)
+    agg = agg.nlargest(n, "total_runs")
     return agg
 
 
+@_cached_on("fact_deliveries.csv")
 def get_wicket_takers(n: int = 10) -> pd.DataFrame:
     """
     Return top wicket takers by count of dismissals.
     """
-    df = _load_csv("fact_deliveries.csv")
+    df = _load_csv("fact_deliveries.csv", columns=("bowler", "player_dismissed"))
     if "bowler" not in df.columns or "player_dismissed" not in df.columns:
         raise ValueError("Required columns missing in fact_deliveries.csv")
 
-    wickets = df[df["player_dismissed"].notna()]
+    # count() already skips missing dismissals, so group the full frame
+    # rather than materialising a filtered copy of every wicket ball.
     agg = (
-        wickets.groupby("bowler")["player_dismissed"]
+        df.groupby("bowler")["player_dismissed"]
         .count()
         .reset_index()
         .rename(columns={"bowler": "player_name", "player_dismissed": "wickets"})
     )
-    agg = agg.sort_values("wickets", ascending=False).head(n)
+    agg = agg[agg["wickets"] > 0]
+    agg = agg.nlargest(n, "wickets")
     return agg
 
 
+@_cached_on("fact_deliveries.csv", "fact_matches.csv")
 def get_venue_performance() -> pd.DataFrame:
     """
     Aggregate average scores per venue.
     """
-    deliveries = _load_csv("fact_deliveries.csv")
-    matches = _load_csv("fact_matches.csv")
+    deliveries = _load_csv(
+        "fact_deliveries.csv", columns=("match_id", "innings", "total_runs")
+    )
+    matches = _load_csv("fact_matches.csv", columns=("match_id", "venue"))
 
     if "match_id" not in deliveries.columns or "match_id" not in matches.columns:
         raise ValueError("match_id missing in input tables")
@@ -87,28 +171,42 @@ def get_venue_performance() -> pd.DataFrame:
     return venue_stats
 
 
+def _lowered_strings(column: pd.Series) -> pd.Series:
+    """Lower-cased string cells of `column`; NaN for every other value."""
+    try:
+        return column.astype(object).str.lower()
+    except AttributeError:  # no string cells at all
+        return pd.Series(np.nan, index=column.index, dtype=object)
+
+
+@_cached_on("fact_matches.csv")
 def get_toss_impact() -> pd.DataFrame:
     """
     Analyze toss impact by decision and result.
     """
-    matches = _load_csv("fact_matches.csv")
+    matches = _load_csv(
+        "fact_matches.csv", columns=("toss_winner", "toss_decision", "result")
+    )
     required = {"toss_winner", "toss_decision", "result"}
     if not required.issubset(matches.columns):
         raise ValueError(f"Required columns missing: {required}")
 
-    # Example: interpret result text to derive winner field
-    matches = matches.copy()
-    matches["toss_won_and_match_won"] = matches.apply(
-        lambda row: 1
-        if isinstance(row.get("result"), str)
-        and isinstance(row.get("toss_winner"), str)
-        and row["toss_winner"].lower() in row["result"].lower()
-        else 0,
-        axis=1,
-    )
+    if matches.empty:
+        return pd.DataFrame(columns=["toss_decision", "win_rate_when_toss_won"])
+
+    # Example: interpret result text to derive winner field.
+    # Column-wise case-insensitive "toss winner named in result" test; cells
+    # that are not strings (NaN, numbers) never count as a win.
+    toss_winners = _lowered_strings(matches["toss_winner"])
+    results = _lowered_strings(matches["result"])
+    known = toss_winners.notna() & results.notna()
+    toss_won_and_match_won = pd.Series(0, index=matches.index, name="toss_won_and_match_won")
+    toss_won_and_match_won[known] = (
+        np.char.find(results[known].to_numpy(dtype=str), toss_winners[known].to_numpy(dtype=str)) >= 0
+    ).astype(int)
 
     agg = (
-        matches.groupby("toss_decision")["toss_won_and_match_won"]
+        toss_won_and_match_won.groupby(matches["toss_decision"])
         .mean()
         .reset_index()
         .rename(
@@ -120,12 +218,11 @@ def get_toss_impact() -> pd.DataFrame:
     return agg
 
 
+@_cached_on("fact_deliveries.csv")
 def get_run_distributions(by: Literal["innings", "over", "team"] = "innings") -> pd.DataFrame:
     """
     Return run distribution grouped by innings / over / team.
     """
-    deliveries = _load_csv("fact_deliveries.csv")
-
     if by == "innings":
         group_cols = ["match_id", "innings"]
     elif by == "over":
@@ -135,6 +232,9 @@ def get_run_distributions(by: Literal["innings", "over", "team"] = "innings") ->
     else:
         raise ValueError(f"Unsupported grouping: {by}")
 
+    deliveries = _load_csv(
+        "fact_deliveries.csv", columns=(*group_cols, "total_runs")
+    )
     missing = [c for c in group_cols if c not in deliveries.columns]
     if missing:
         raise ValueError(f"Required columns missing in fact_deliveries.csv: {missing}")
@@ -156,6 +256,11 @@ def plot_distribution(
 
     Returns a Matplotlib Figure and Axes, which Streamlit can render.
     """
+    # Plotting libraries are only needed here; keep them off the import path
+    # of the aggregation helpers.
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(10, 6))
     sns.barplot(data=df, x=x, y=y, ax=ax)
     ax.set_title(title)
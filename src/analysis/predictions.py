@@ -1,10 +1,10 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
-import streamlit as st
 
 MODELS_DIR = Path("models")
 PROCESSED_DIR = Path("data/processed")
@@ -12,8 +12,15 @@ PROCESSED_DIR = Path("data/processed")
 # --- Helper functions ---
 def _load_model(name: str) -> Dict:
     path = MODELS_DIR / name
-    if not path.exists():
-        raise FileNotFoundError(f"Model file '{path}' not found.")
+    try:
+        version = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Model file '{path}' not found.") from None
+    return _load_model_bundle(path, version)
+
+@lru_cache(maxsize=8)
+def _load_model_bundle(path: Path, version: int) -> Dict:
+    """Deserialized model bundle, memoized on the file mtime so a retrained model is reloaded."""
     return joblib.load(path)
 
 def _load_csv(name: str) -> pd.DataFrame:
@@ -25,12 +32,44 @@ def _load_csv(name: str) -> pd.DataFrame:
         df = df.drop(columns=["Unnamed: 0"])
     return df
 
+def _file_version(name: str) -> int:
+    path = PROCESSED_DIR / name
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Processed file '{path}' not found.") from None
+
+@lru_cache(maxsize=1)
+def _player_run_totals(version: int) -> Tuple[Dict[str, float], float]:
+    """Per-batter run totals keyed by lower-cased name, memoized on the deliveries file mtime."""
+    deliveries = _load_csv("fact_deliveries.csv")
+    batter_col = next((c for c in ["batter", "batsman", "striker", "player_name"] if c in deliveries.columns), None)
+    if batter_col is None:
+        raise ValueError("Deliveries file does not contain a batter column.")
+
+    runs_col = next((c for c in ["batsman_runs", "runs_off_bat", "runs_scored", "total_runs"] if c in deliveries.columns), None)
+    if runs_col is None:
+        raise ValueError("Deliveries file does not contain a batsman runs column.")
+
+    player_totals = deliveries.groupby(batter_col)[runs_col].sum()
+
+    totals: Dict[str, float] = {}
+    for name, runs in zip(player_totals.index, player_totals.to_numpy()):
+        totals.setdefault(str(name).lower(), float(runs))
+    default = float(player_totals.mean()) if len(player_totals) else 25.0
+    return totals, default
+
 # --- WIN PROBABILITY ---
 def predict_match_outcome(team1: str, team2: str, venue: str, toss_decision: str, match_id: Optional[int] = None) -> float:
     """Alias for predict_win_probability for backward compatibility"""
     return predict_win_probability(team1, team2, venue, toss_decision, match_id)
 
 def predict_win_probability(team1: str, team2: str, venue: str, toss_decision: str, match_id: Optional[int] = None) -> float:
+    fixture = {"team1": team1, "team2": team2, "venue": venue, "toss_decision": toss_decision, "match_id": match_id}
+    return predict_win_probability_batch([fixture])[0]
+
+def predict_win_probability_batch(fixtures: List[Dict[str, Any]]) -> List[float]:
+    """Win probabilities for several fixtures (predict_win_probability kwargs) with one predict_proba call."""
     bundle = _load_model("win_prediction_logreg.joblib")
     model = bundle["model"]
 
@@ -38,12 +77,17 @@ def predict_win_probability(team1: str, team2: str, venue: str, toss_decision: s
     if "match_id" not in matches.columns:
         raise ValueError("Column 'match_id' missing in fact_matches.csv")
 
-    if match_id is None:
+    if not fixtures:
+        return []
+
+    match_ids = [fixture.get("match_id") for fixture in fixtures]
+    if any(match_id is None for match_id in match_ids):
         # default to first match or median
-        match_id = int(matches["match_id"].median())
+        default_match_id = int(matches["match_id"].median())
+        match_ids = [default_match_id if match_id is None else match_id for match_id in match_ids]
 
-    X = pd.DataFrame({"match_id": [match_id]})
-    return float(model.predict_proba(X)[0][1])
+    X = pd.DataFrame({"match_id": match_ids})
+    return [float(p) for p in model.predict_proba(X)[:, 1]]
 
 # --- INNINGS SCORE ---
 def predict_innings_score(team: str, venue: str, overs: int = 20) -> float:
@@ -68,24 +112,8 @@ def predict_player_performance(player_name: str, team: Optional[str] = None, ven
     model = bundle["model"]
     scaler = bundle.get("scaler")
 
-    deliveries = _load_csv("fact_deliveries.csv")
-    batter_col = next((c for c in ["batter", "batsman", "striker", "player_name"] if c in deliveries.columns), None)
-    if batter_col is None:
-        raise ValueError("Deliveries file does not contain a batter column.")
-
-    runs_col = next((c for c in ["batsman_runs", "runs_off_bat", "runs_scored", "total_runs"] if c in deliveries.columns), None)
-    if runs_col is None:
-        raise ValueError("Deliveries file does not contain a batsman runs column.")
-
-    player_totals = (
-        deliveries.groupby(batter_col)[runs_col]
-        .sum()
-        .reset_index()
-        .rename(columns={batter_col: "player_name", runs_col: "total_runs"})
-    )
-
-    row = player_totals[player_totals["player_name"].str.lower() == player_name.lower()]
-    total_runs = float(row["total_runs"].iloc[0]) if not row.empty else float(player_totals["total_runs"].mean() if len(player_totals) else 25.0)
+    totals, default = _player_run_totals(_file_version("fact_deliveries.csv"))
+    total_runs = totals.get(player_name.lower(), default)
 
     X = pd.DataFrame([[total_runs]], columns=["total_runs"])
     if scaler is not None:
@@ -99,33 +127,45 @@ def predict_player_performance(player_name: str, team: Optional[str] = None, ven
 
 # --- STREAMLIT PAGE ---
 def main():
+    # Only the Streamlit page needs streamlit; the backend imports the predictors alone.
+    import streamlit as st
+
     st.title("🏏 Cricket Predictions")
 
     matches = _load_csv("fact_matches.csv")
     team_list = sorted(pd.unique(matches[["team1", "team2"]].values.ravel()))
     venues = sorted(pd.unique(matches["venue"]))
 
-    st.subheader("Match Win Probability")
-    team1 = st.selectbox("Team 1", team_list)
-    team2 = st.selectbox("Team 2", team_list)
-    venue = st.selectbox("Venue", venues)
-    toss = st.radio("Toss decision", ["bat", "field"])
-    match_id_input = st.number_input("Match ID", min_value=int(matches["match_id"].min()), max_value=int(matches["match_id"].max()), value=int(matches["match_id"].min()))
-
-    try:
-        win_prob = predict_win_probability(team1, team2, venue, toss, match_id_input)
-        st.success(f"Win Probability for {team1}: {win_prob*100:.2f}%")
-    except Exception as e:
-        st.error(f"Win prediction failed: {e}")
-
-    st.subheader("Innings Score Prediction")
-    score = predict_innings_score(team1, venue, overs=20)
-    st.info(f"Predicted innings score for {team1}: {score:.2f}")
-
-    st.subheader("Player Performance Prediction")
-    player_name = st.text_input("Player Name", "Sample Player")
-    perf = predict_player_performance(player_name)
-    st.info(f"{player_name} predicted runs: {perf['predicted_runs']:.2f} (historical total: {perf['historical_total_runs']:.2f})")
+    # Forms batch the widget changes, so predictions only run on submit
+    # instead of on every selectbox / keystroke rerun.
+    with st.form("match_prediction"):
+        st.subheader("Match Win Probability")
+        team1 = st.selectbox("Team 1", team_list)
+        team2 = st.selectbox("Team 2", team_list)
+        venue = st.selectbox("Venue", venues)
+        toss = st.radio("Toss decision", ["bat", "field"])
+        match_id_input = st.number_input("Match ID", min_value=int(matches["match_id"].min()), max_value=int(matches["match_id"].max()), value=int(matches["match_id"].min()))
+        match_submitted = st.form_submit_button("Predict")
+
+    if match_submitted:
+        try:
+            win_prob = predict_win_probability(team1, team2, venue, toss, match_id_input)
+            st.success(f"Win Probability for {team1}: {win_prob*100:.2f}%")
+        except Exception as e:
+            st.error(f"Win prediction failed: {e}")
+
+        st.subheader("Innings Score Prediction")
+        score = predict_innings_score(team1, venue, overs=20)
+        st.info(f"Predicted innings score for {team1}: {score:.2f}")
+
+    with st.form("player_prediction"):
+        st.subheader("Player Performance Prediction")
+        player_name = st.text_input("Player Name", "Sample Player")
+        player_submitted = st.form_submit_button("Predict")
+
+    if player_submitted:
+        perf = predict_player_performance(player_name)
+        st.info(f"{player_name} predicted runs: {perf['predicted_runs']:.2f} (historical total: {perf['historical_total_runs']:.2f})")
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,28 @@ from typing import Dict, Optional, Union
 
 import pandas as pd
 
+# Canonical short names for franchises, built once at import
+TEAM_NAME_MAPPING: Dict[str, str] = {
+    "Royal Challengers Bangalore": "RCB",
+    "Royal Challengers Bengaluru": "RCB",
+    "Delhi Daredevils": "DC",
+    "Delhi Capitals": "DC",
+    "Kings XI Punjab": "PBKS",
+    "Punjab Kings": "PBKS",
+    "Rising Pune Supergiants": "RPS",
+    "Gujarat Lions": "GL",
+    "Pune Warriors India": "PWI",
+    "Kochi Tuskers Kerala": "KTK",
+    "Rising Pune Supergiant": "RPS",
+    "Deccan Chargers": "DC",
+    "Sunrisers Hyderabad": "SRH",
+    "Mumbai Indians": "MI",
+    "Chennai Super Kings": "CSK",
+    "Kolkata Knight Riders": "KKR",
+    "Rajasthan Royals": "RR"
+}
+
+
 def _ensure_dir(path: Union[str, Path]) -> None:
     """Ensure directory exists, create if it doesn't."""
     Path(path).mkdir(parents=True, exist_ok=True)
@@ -78,28 +100,8 @@ def _standardize_team_names(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
     if column not in df.columns:
         return df
-        
-    mapping: Dict[str, str] = {
-        "Royal Challengers Bangalore": "RCB",
-        "Royal Challengers Bengaluru": "RCB",
-        "Delhi Daredevils": "DC",
-        "Delhi Capitals": "DC",
-        "Kings XI Punjab": "PBKS",
-        "Punjab Kings": "PBKS",
-        "Rising Pune Supergiants": "RPS",
-        "Gujarat Lions": "GL",
-        "Pune Warriors India": "PWI",
-        "Kochi Tuskers Kerala": "KTK",
-        "Rising Pune Supergiant": "RPS",
-        "Deccan Chargers": "DC",
-        "Sunrisers Hyderabad": "SRH",
-        "Mumbai Indians": "MI",
-        "Chennai Super Kings": "CSK",
-        "Kolkata Knight Riders": "KKR",
-        "Rajasthan Royals": "RR"
-    }
     
-    df[column] = df[column].astype(str).str.strip().replace(mapping)
+    df[column] = df[column].astype(str).str.strip().replace(TEAM_NAME_MAPPING)
     return df
 
 
@@ -233,11 +235,21 @@ def clean_all(raw_dir: Union[str, Path], processed_dir: Union[str, Path]) -> str
         deliveries_path = raw_dir / "deliveries.csv"
         players_path = raw_dir / "players.csv"
 
-        if not matches_path.exists() and not deliveries_path.exists():
+        # One directory listing answers every raw-file existence check below
+        try:
+            with os.scandir(raw_dir) as it:
+                raw_files = {entry.name for entry in it if entry.is_file()}
+        except FileNotFoundError:
+            raw_files = set()
+        has_matches = matches_path.name in raw_files
+        has_deliveries = deliveries_path.name in raw_files
+        has_players = players_path.name in raw_files
+
+        if not has_matches and not has_deliveries:
             raise FileNotFoundError("No input CSV files found. Need at least matches.csv or deliveries.csv in the raw directory.")
 
         # ------------------- PROCESS MATCHES --------------------
-        if matches_path.exists():
+        if has_matches:
             print("🔍 Processing matches data...")
             dfm = pd.read_csv(matches_path, low_memory=False)
             print(f"   Found {len(dfm)} matches")
@@ -267,7 +279,7 @@ def clean_all(raw_dir: Union[str, Path], processed_dir: Union[str, Path]) -> str
             dfm = None
 
         # ------------------- PROCESS DELIVERIES --------------------
-        if deliveries_path.exists():
+        if has_deliveries:
             print("🔍 Processing deliveries data...")
             dfd = pd.read_csv(deliveries_path, low_memory=False)
             print(f"   Found {len(dfd)} deliveries")
@@ -295,7 +307,7 @@ def clean_all(raw_dir: Union[str, Path], processed_dir: Union[str, Path]) -> str
             dfd = None
 
         # ------------------- PROCESS PLAYERS --------------------
-        if players_path.exists():
+        if has_players:
             print("🔍 Processing players data...")
             try:
                 dfp = pd.read_csv(players_path, low_memory=False)
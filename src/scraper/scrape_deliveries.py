@@ -11,6 +11,8 @@ import requests
 from bs4 import BeautifulSoup
 from requests import Response
 
+from .scrape_matches import FETCH_WORKERS, submit_in_order
+
 BASE_URL = "https://www.espncricinfo.com"
 RAW_DIR = "data/raw"
 DELIVERIES_CSV = os.path.join(RAW_DIR, "deliveries.csv")
@@ -191,20 +193,25 @@ def _write_dicts_to_csv(path: str, records: Iterable[Dict[str, Optional[str]]])
 # Public orchestrator
 # ---------------------------------------------------------------------------
 
-def scrape_deliveries_for_matches(match_urls: List[str], output_dir: str = RAW_DIR) -> str:
+def scrape_deliveries_for_matches(
+    match_urls: List[str], output_dir: str = RAW_DIR, max_workers: int = FETCH_WORKERS
+) -> str:
     """
     Scrape ball-by-ball data for a list of commentary/ball-by-ball URLs.
 
+    Pages are downloaded concurrently and parsed in URL order.
+
     NOTE:
         - For full-scorecard URLs, you typically need to replace the last segment
           with `/ball-by-ball-commentary` to get full delivery-level data.
     """
     all_deliveries: List[Dict[str, Optional[str]]] = []
 
-    for idx, url in enumerate(match_urls, start=1):
+    pages = submit_in_order(fetch_html, match_urls, max_workers=max_workers)
+    for idx, (url, page) in enumerate(pages, start=1):
         try:
             print(f"[scrape_deliveries_for_matches] ({idx}/{len(match_urls)}) {url}")
-            html = fetch_html(url)
+            html = page.result()
             soup = BeautifulSoup(html, "lxml")
             rows = parse_ball_by_ball(soup, url=url)
             all_deliveries.extend(rows)
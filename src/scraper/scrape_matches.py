@@ -6,7 +6,10 @@ import csv
 import os
 import re
 import time
-from typing import Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 import requests
 from bs4 import BeautifulSoup
@@ -16,6 +19,10 @@ BASE_URL = "https://www.espncricinfo.com"
 RAW_DIR = "data/raw"
 MATCHES_CSV = os.path.join(RAW_DIR, "matches.csv")
 PLAYERS_CSV = os.path.join(RAW_DIR, "players.csv")
+# Concurrent page downloads per scrape; kept small to stay polite to the site
+FETCH_WORKERS = 4
+
+T = TypeVar("T")
 
 
 # ---------------------------------------------------------------------------
@@ -50,6 +57,32 @@ def fetch_html(url: str, retries: int = 3, backoff: float = 2.0, timeout: int =
     raise last_exc
 
 
+def submit_in_order(
+    func: Callable[[str], T], urls: List[str], max_workers: int = FETCH_WORKERS
+) -> Iterator[Tuple[str, Future[T]]]:
+    """
+    Yield (url, future) pairs in URL order, running `func` on at most
+    `max_workers` URLs ahead of the consumer.
+
+    Each future is dropped once yielded, so only the in-flight pages are held
+    in memory rather than every page of the scrape.
+
+    Progress lines printed by the caller's loop stay in URL order, but
+    anything `func` prints itself (e.g. the [fetch_html] retries) comes from
+    the worker threads and may interleave.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        remaining = iter(urls)
+        pending: Deque[Tuple[str, Future[T]]] = deque(
+            (url, pool.submit(func, url)) for url in islice(remaining, max_workers)
+        )
+        while pending:
+            url, future = pending.popleft()
+            for next_url in islice(remaining, 1):
+                pending.append((next_url, pool.submit(func, next_url)))
+            yield url, future
+
+
 def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
@@ -325,11 +358,14 @@ def scrape_match(url: str) -> Tuple[Dict[str, Optional[str]], List[Dict[str, Opt
     return match_info, player_rows
 
 
-def scrape_matches_for_season(season_url: str, output_dir: str = RAW_DIR) -> str:
+def scrape_matches_for_season(
+    season_url: str, output_dir: str = RAW_DIR, max_workers: int = FETCH_WORKERS
+) -> str:
     """
     Scrape all full-scorecard links found on a season/series page.
 
-    Returns the path of the matches CSV file.
+    Scorecards are downloaded concurrently (network-bound) and collected in
+    page order. Returns the path of the matches CSV file.
     """
     print(f"[scrape_matches_for_season] Season URL: {season_url}")
     season_html = fetch_html(season_url)
@@ -338,10 +374,11 @@ def scrape_matches_for_season(season_url: str, output_dir: str = RAW_DIR) -> str
     all_matches: List[Dict[str, Optional[str]]] = []
     all_players: List[Dict[str, Optional[str]]] = []
 
-    for idx, url in enumerate(match_urls, start=1):
+    scraped = submit_in_order(scrape_match, match_urls, max_workers=max_workers)
+    for idx, (url, future) in enumerate(scraped, start=1):
         try:
             print(f"[scrape_matches_for_season] ({idx}/{len(match_urls)}) {url}")
-            match_info, players = scrape_match(url)
+            match_info, players = future.result()
             all_matches.append(match_info)
             all_players.extend(players)
         except Exception as exc:  # pragma: no cover - robust for scraping
@@ -10,11 +10,13 @@ from bs4 import BeautifulSoup
 
 from .scrape_matches import (
     BASE_URL,
+    FETCH_WORKERS,
     RAW_DIR,
     PLAYERS_CSV,
     fetch_html,
     parse_match_list_page,
     parse_player_stats,
+    submit_in_order,
 )
 
 
@@ -43,15 +45,20 @@ def _write_dicts_to_csv(path: str, records: Iterable[Dict[str, Optional[str]]])
     return path
 
 
-def scrape_players_from_matches(match_urls: List[str], output_dir: str = RAW_DIR) -> str:
+def scrape_players_from_matches(
+    match_urls: List[str], output_dir: str = RAW_DIR, max_workers: int = FETCH_WORKERS
+) -> str:
     """
     Scrape player batting + bowling stats from a list of full-scorecard URLs.
+
+    Pages are downloaded concurrently and parsed in URL order.
     """
     all_players: List[Dict[str, Optional[str]]] = []
-    for idx, url in enumerate(match_urls, start=1):
+    pages = submit_in_order(fetch_html, match_urls, max_workers=max_workers)
+    for idx, (url, page) in enumerate(pages, start=1):
         try:
             print(f"[scrape_players_from_matches] ({idx}/{len(match_urls)}) {url}")
-            html = fetch_html(url)
+            html = page.result()
             soup = BeautifulSoup(html, "lxml")
             rows = parse_player_stats(soup, url=url)
             all_players.extend(rows)
@@ -69,7 +76,9 @@ def scrape_players_from_matches(match_urls: List[str], output_dir: str = RAW_DIR
     return players_path
 
 
-def scrape_players(player_index_url: str, output_dir: str = RAW_DIR) -> str:
+def scrape_players(
+    player_index_url: str, output_dir: str = RAW_DIR, max_workers: int = FETCH_WORKERS
+) -> str:
     
     print(f"[scrape_players] Entry URL: {player_index_url}")
 
@@ -79,7 +88,7 @@ def scrape_players(player_index_url: str, output_dir: str = RAW_DIR) -> str:
         html = fetch_html(player_index_url)
         match_urls = parse_match_list_page(html)
 
-    return scrape_players_from_matches(match_urls, output_dir=output_dir)
+    return scrape_players_from_matches(match_urls, output_dir=output_dir, max_workers=max_workers)
 
 
 def main() -> None:
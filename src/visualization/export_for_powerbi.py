@@ -50,12 +50,12 @@ def _create_dim_teams(matches: pd.DataFrame) -> pd.DataFrame:
     
     Extracts unique teams from team1 and team2 columns.
     """
-    teams = set()
-    
-    if "team1" in matches.columns:
-        teams.update(matches["team1"].dropna().unique())
-    if "team2" in matches.columns:
-        teams.update(matches["team2"].dropna().unique())
+    team_cols = [col for col in ("team1", "team2") if col in matches.columns]
+    teams = (
+        pd.unique(pd.concat([matches[col] for col in team_cols], ignore_index=True).dropna())
+        if team_cols
+        else []
+    )
     
     dim_teams = pd.DataFrame({
         "team_name": sorted(teams),
@@ -196,22 +196,19 @@ def _create_fact_player_innings(deliveries: pd.DataFrame, matches: pd.DataFrame)
                 how="left"
             )
         
-        # Identify batting team
+        # Identify batting team (vectorized join / select instead of per-row apply)
         if "batting_team" in deliveries.columns:
+            # Like the old (match_id, innings) -> team dict: when the team
+            # changes within an innings, the last distinct value wins.
             batting_team_map = (
                 deliveries[["match_id", "innings", "batting_team"]]
                 .drop_duplicates()
-                .set_index(["match_id", "innings"])["batting_team"]
-                .to_dict()
-            )
-            combined["batting_team"] = combined.apply(
-                lambda row: batting_team_map.get((row["match_id"], row["innings"]), None),
-                axis=1
+                .drop_duplicates(subset=["match_id", "innings"], keep="last")
             )
+            combined = combined.merge(batting_team_map, on=["match_id", "innings"], how="left")
         elif "team1" in combined.columns and "team2" in combined.columns:
-            combined["batting_team"] = combined.apply(
-                lambda row: row["team1"] if row["innings"] == 1 else row["team2"],
-                axis=1
+            combined["batting_team"] = combined["team1"].where(
+                combined["innings"] == 1, combined["team2"]
             )
         
         return combined
@@ -353,9 +350,9 @@ def export_for_powerbi(include_predictions: bool = False) -> Dict[str, str]:
 def main() -> None:
     """CLI entrypoint for Power BI export."""
     outputs = export_for_powerbi(include_predictions=False)
-    print("\n[export_for_powerbi] Exported files:")
-    for name, path in outputs.items():
-        print(f"  - {name}: {path}")
+    lines = ["\n[export_for_powerbi] Exported files:"]
+    lines.extend(f"  - {name}: {path}" for name, path in outputs.items())
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":